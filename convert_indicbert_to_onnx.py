@@ -9,6 +9,135 @@ import shutil
 import warnings
 warnings.filterwarnings("ignore")
 
+
+def optimize_graph(onnx_path, file_name="model.onnx"):
+    """O2 transformer fusions (Attention, SkipLayerNormalization, Gelu)"""
+    from optimum.onnxruntime import ORTOptimizer
+    from optimum.onnxruntime.configuration import OptimizationConfig
+    
+    # FP32 fusions only: fp16 gains nothing on the CPU kernels
+    optimization_config = OptimizationConfig(optimization_level=2, optimize_for_gpu=False, fp16=False)
+    optimizer = ORTOptimizer.from_pretrained(onnx_path, file_names=[file_name])
+    optimizer.optimize(optimization_config=optimization_config, save_dir=onnx_path)
+    return file_name.replace(".onnx", "_optimized.onnx")
+
+
+def quantize_int8(onnx_path, file_name="model.onnx"):
+    """Dynamic INT8 quantization targeting ARM64 (Cortex-A76 SDOT kernels)"""
+    import onnx
+    from onnxruntime.quantization import quantize_dynamic
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    
+    # Fuse first so attention blocks become single QAttention nodes
+    source_name = file_name
+    try:
+        source_name = optimize_graph(onnx_path, file_name)
+        print("   ✓ Graph optimized (O2 fusions)")
+    except Exception as e:
+        print(f"   ⚠️  Graph optimization skipped: {e}")
+    
+    # Dynamic quantization emits MatMulInteger/DynamicQuantizeLinear nodes,
+    # which ORT's MLAS dispatches to the aarch64 SDOT/UDOT kernels.
+    # (avx512_vnni/avx2 configs would only help on x86.)
+    # Per-channel weight scales keep IndicBERT's logits close to FP32
+    # (per-tensor PTQ flattens confidences below the classify() threshold)
+    qconfig = AutoQuantizationConfig.arm64(is_static=False, use_symmetric_weights=True, per_channel=True)
+    # 7-bit weights: u8 x s8 products can't saturate the 16-bit intermediate
+    # on kernels without a dot-product path (arm64 preset hardcodes False)
+    qconfig.reduce_range = True
+    
+    # ORTQuantizer can't pass DefaultTensorType, which shape inference needs
+    # on the fused contrib ops, so apply the arm64 preset via quantize_dynamic
+    quantized_file = os.path.join(onnx_path, "model_quantized.onnx")
+    quantize_dynamic(
+        os.path.join(onnx_path, source_name),
+        quantized_file,
+        op_types_to_quantize=qconfig.operators_to_quantize,
+        per_channel=qconfig.per_channel,
+        reduce_range=qconfig.reduce_range,
+        weight_type=qconfig.weights_dtype,
+        extra_options={
+            "WeightSymmetric": qconfig.weights_symmetric,
+            "ActivationSymmetric": qconfig.activations_symmetric,
+            "DefaultTensorType": onnx.TensorProto.FLOAT,
+        }
+    )
+    
+    if source_name != file_name:
+        os.remove(os.path.join(onnx_path, source_name))
+    return quantized_file
+
+
+def embed_label_map(onnx_file, label_map_file):
+    """Store id2label in the ONNX metadata so the runtime needs no extra file"""
+    import json
+    import onnx
+    
+    with open(label_map_file, 'r') as f:
+        id2label = json.load(f)['id2label']
+    
+    model = onnx.load(onnx_file)
+    for prop in list(model.metadata_props):
+        if prop.key == "id2label":
+            model.metadata_props.remove(prop)
+    meta = model.metadata_props.add()
+    meta.key = "id2label"
+    meta.value = json.dumps(id2label, ensure_ascii=False)
+    onnx.save(model, onnx_file)
+
+
+def embed_labels_all(onnx_path):
+    """Embed labels into every exported graph (FP32 and INT8 if present)"""
+    label_map_file = os.path.join(onnx_path, "label_map.json")
+    for name in ["model.onnx", "model_quantized.onnx"]:
+        onnx_file = os.path.join(onnx_path, name)
+        if os.path.exists(onnx_file):
+            embed_label_map(onnx_file, label_map_file)
+
+
+# Short commands the assistant hears most; used to sanity-check the INT8 graph
+CHECK_PHRASES = [
+    "समय क्या है", "तारीख", "नमस्ते", "अलविदा", "धन्यवाद", "सहायता", "बंद करो",
+    "नाचो", "मौसम कैसा है", "मजाक सुनाओ", "गाना बजाओ", "समाचार बताओ",
+]
+
+
+def check_int8_agreement(onnx_path, tokenizer, max_conf_drop=0.10):
+    """
+    Compare INT8 vs FP32 predictions on CHECK_PHRASES.
+    Drops model_quantized.onnx (runtime then uses FP32) if quantization
+    flips a label or costs too much confidence.
+    """
+    import numpy as np
+    import onnxruntime as ort
+    
+    def predict(file_name):
+        session = ort.InferenceSession(
+            os.path.join(onnx_path, file_name), providers=["CPUExecutionProvider"]
+        )
+        names = {i.name for i in session.get_inputs()}
+        results = []
+        for text in CHECK_PHRASES:
+            inputs = tokenizer(text, return_tensors="np", max_length=64, truncation=True, padding=True)
+            feed = {k: v.astype(np.int64) for k, v in inputs.items() if k in names}
+            logits = session.run(None, feed)[0][0]
+            idx = int(logits.argmax())
+            results.append((idx, 1.0 / float(np.exp(logits - logits[idx]).sum())))
+        return results
+    
+    fp32 = predict("model.onnx")
+    int8 = predict("model_quantized.onnx")
+    flips = sum(a[0] != b[0] for a, b in zip(fp32, int8))
+    conf_drop = max(a[1] - b[1] for a, b in zip(fp32, int8))
+    print(f"   INT8 vs FP32: {flips} label flips, max confidence drop {conf_drop:.1%}")
+    
+    if flips or conf_drop > max_conf_drop:
+        os.remove(os.path.join(onnx_path, "model_quantized.onnx"))
+        print("   ⚠️  INT8 accuracy check failed, keeping FP32 model")
+        return False
+    return True
+
+
 print("=" * 60)
 print("Converting IndicBERT to ONNX (Version-Safe)")
 print("=" * 60)
@@ -53,24 +182,38 @@ try:
     model.save_pretrained(onnx_path)
     tokenizer.save_pretrained(onnx_path)
     
-    # Copy label map
+    # INT8 quantization (ARM64 dynamic); the FP32 export above is kept if it fails
+    quantized = False
+    try:
+        print("   Quantizing to INT8 (ARM64 dynamic)...")
+        onnx_file = quantize_int8(onnx_path)
+        quantized = check_int8_agreement(onnx_path, tokenizer)
+        if not quantized:
+            onnx_file = os.path.join(onnx_path, "model.onnx")
+    except Exception as qe:
+        print(f"   ⚠️  INT8 quantization failed: {qe}")
+        onnx_file = os.path.join(onnx_path, "model.onnx")
+        quantized_file = os.path.join(onnx_path, "model_quantized.onnx")
+        if os.path.exists(quantized_file):
+            os.remove(quantized_file)  # unchecked graph: runtime would prefer it
+    
+    # Copy label map (kept as fallback) and embed it in the graphs
     shutil.copy(
         os.path.join(pytorch_path, "label_map.json"),
         os.path.join(onnx_path, "label_map.json")
     )
+    embed_labels_all(onnx_path)
     
     print(f"✓ Conversion successful!")
     print(f"✓ Model saved to: {onnx_path}")
     
     # Check file size
-    import glob
-    onnx_files = glob.glob(f"{onnx_path}/*.onnx")
-    if onnx_files:
-        size_mb = os.path.getsize(onnx_files[0]) / (1024 * 1024)
-        print(f"✓ ONNX model size: {size_mb:.1f} MB")
+    if os.path.exists(onnx_file):
+        size_mb = os.path.getsize(onnx_file) / (1024 * 1024)
+        print(f"✓ ONNX {'INT8' if quantized else 'FP32'} model size: {size_mb:.1f} MB")
     
     print("\n" + "=" * 60)
-    print("✅ CONVERSION COMPLETE")
+    print(f"✅ CONVERSION COMPLETE ({'INT8' if quantized else 'FP32'})")
     print("=" * 60)
     print("Restart voice_assistant.py to use optimized model")
     
@@ -127,16 +270,31 @@ except Exception as e:
         print(f"✓ Direct export successful!")
         print(f"✓ Model saved to: {onnx_path}")
         
+        # INT8 quantization (needs optimum, which may be what failed above)
+        quantized = False
+        try:
+            print("   Quantizing to INT8 (ARM64 dynamic)...")
+            onnx_file = quantize_int8(onnx_path)
+            quantized = check_int8_agreement(onnx_path, tokenizer)
+            if not quantized:
+                onnx_file = os.path.join(onnx_path, "model.onnx")
+        except Exception as qe:
+            print(f"   ⚠️  INT8 quantization failed: {qe}")
+            onnx_file = os.path.join(onnx_path, "model.onnx")
+        
+        # Embed label map in the graphs (label_map.json kept as fallback)
+        embed_labels_all(onnx_path)
+        
         # Check file size
-        onnx_file = os.path.join(onnx_path, "model.onnx")
         if os.path.exists(onnx_file):
             size_mb = os.path.getsize(onnx_file) / (1024 * 1024)
             print(f"✓ ONNX model size: {size_mb:.1f} MB")
         
         print("\n" + "=" * 60)
-        print("✅ CONVERSION COMPLETE (FP32)")
+        print(f"✅ CONVERSION COMPLETE ({'INT8' if quantized else 'FP32'})")
         print("=" * 60)
-        print("Note: No INT8 quantization (still faster than PyTorch)")
+        if not quantized:
+            print("Note: No INT8 quantization (still faster than PyTorch)")
         print("Restart voice_assistant.py to use optimized model")
         
     except Exception as e2:
@@ -79,13 +79,19 @@ def set_thread_envs():
         "MKL_NUM_THREADS": "2",
         "OPENBLAS_NUM_THREADS": "2",
         "VECLIB_MAXIMUM_THREADS": "2",
-        "NUMEXPR_NUM_THREADS": "2"
+        "NUMEXPR_NUM_THREADS": "2",
+        "OMP_WAIT_POLICY": "PASSIVE"
     }
     
     log("ℹ️  Add these to your .bashrc or venv/bin/activate for persistence:")
     for k, v in envs.items():
         log(f"   export {k}={v}")
         os.environ[k] = v
+    
+    # 2 threads per pool = the two A76 cores; voice_assistant.py pins them there
+    log("ℹ️  Core affinity (set by voice_assistant.py via sched_setaffinity):")
+    log("   Cores 0-1 (A76): Whisper + IndicBERT inference threads")
+    log("   Cores 2-7 (A55): audio capture + VAD")
 
 def main():
     log(f"=== Radxa Cubie A7A Optimization Log ({subprocess.check_output(['date']).decode().strip()}) ===")
@@ -1,9 +1,7 @@
 import os
-import sys
 import wave
 import subprocess
 import time
-import whisper
 import pyaudio
 import numpy as np
 
@@ -17,22 +15,6 @@ def test_tts():
     except Exception as e:
         print(f"❌ TTS test failed: {e}")
 
-def test_asr():
-    """Test Whisper ASR with Hindi audio file"""
-    print("📝 Testing ASR (Whisper base)...")
-    try:
-        model_start = time.time()
-        model = whisper.load_model("base")
-        load_time = time.time() - model_start
-        print(f"✅ Whisper model loaded in {load_time:.2f}s")
-        
-        # Test with a dummy or empty audio if possible, 
-        # but here we just verify the model is ready.
-        print("✅ ASR test passed!")
-        return True
-    except Exception as e:
-        print(f"❌ ASR test failed: {e}")
-
 def test_piper_tts():
     """Test Piper TTS with Hindi voice"""
     print("🔊 Testing Piper TTS (Natural Voice)...")
@@ -45,21 +27,17 @@ def test_piper_tts():
     try:
         test_text = "नमस्ते, यह पाइपर टीटीएस का परीक्षण है"
         
-        # Test Piper
-        piper = subprocess.Popen(
-            [sys.executable, '-m', 'piper', '--model', model_path, '--output-raw'],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL
-        )
-        audio_data, _ = piper.communicate(input=test_text.encode('utf-8'), timeout=10)
+        # Test Piper (in-process, same path as the assistant)
+        from voice_assistant import load_piper_voice, piper_synthesize
+        voice = load_piper_voice(model_path)
+        audio_data = piper_synthesize(voice, test_text)
         
         # Play audio using PyAudio
         import pyaudio
         p = pyaudio.PyAudio()
         stream = p.open(format=pyaudio.paInt16,
                         channels=1,
-                        rate=22050,
+                        rate=voice.config.sample_rate,
                         output=True)
         stream.write(audio_data)
         stream.stop_stream()
@@ -106,8 +84,22 @@ def test_advanced_grammar():
             print(f"  {status} '{raw}' → '{corrected}'")
             if corrected.lower() == expected.lower(): passed += 1
                 
-        print(f"\nPassed: {passed}/{len(test_cases)} tests")
-        return passed == len(test_cases)
+        # Unicode case variants (long s, Kelvin sign) must match the
+        # one-re.sub-per-rule result instead of crashing the fused pass
+        import re
+        variants = ["ſamay", "ſtap", "\u212aana", "ſunao", "batal ſamay"]
+        for raw in variants:
+            expected = raw
+            for pattern, replacement in corrector.error_patterns:
+                expected = re.sub(pattern, replacement, expected, flags=re.IGNORECASE)
+            corrected = corrector.fused_pattern.sub(corrector._replace, raw)
+            status = "✓" if corrected == expected else "✗"
+            print(f"  {status} '{raw}' → '{corrected}'")
+            if corrected == expected: passed += 1
+        
+        total = len(test_cases) + len(variants)
+        print(f"\nPassed: {passed}/{total} tests")
+        return passed == total
     except Exception as e:
         print(f"❌ Grammar test failed: {e}")
         return False
@@ -150,15 +142,28 @@ def test_robust_intent():
         ]
         
         passed = 0
+        corrected_texts, single_results = [], []
         for text, expected in test_cases:
             corrected = corrector.correct(text)
             intent, confidence = classifier.classify(corrected)
+            corrected_texts.append(corrected)
+            single_results.append((intent, confidence))
             status = "✓" if intent == expected else "✗"
             print(f"  {status} '{text}' → {intent} ({confidence:.1%})")
             if intent == expected: passed += 1
                 
         print(f"\nPassed: {passed}/{len(test_cases)} tests")
-        return passed == len(test_cases)
+        
+        # Batched path must agree with per-utterance classify() (dynamic INT8
+        # scales are batch-wide, so confidences may differ very slightly)
+        import math
+        batch_results = classifier.classify_batch(corrected_texts)
+        batch_ok = all(
+            b_intent == s_intent and math.isclose(b_conf, s_conf, abs_tol=1e-3)
+            for (b_intent, b_conf), (s_intent, s_conf) in zip(batch_results, single_results)
+        ) and len(batch_results) == len(single_results)
+        print(f"  {'✓' if batch_ok else '✗'} classify_batch matches classify()")
+        return passed == len(test_cases) and batch_ok
     except Exception as e:
         print(f"❌ Robust intent test failed: {e}")
         return False
@@ -169,7 +174,8 @@ def test_asr_faster_whisper():
     try:
         from faster_whisper import WhisperModel
         start_load = time.time()
-        model = WhisperModel("base", device="cpu", compute_type="int8", cpu_threads=4)
+        # Same config as the assistant: 2 threads = the two A76 cores
+        model = WhisperModel("base", device="cpu", compute_type="int8", cpu_threads=2, num_workers=1)
         print(f"✅ Faster-Whisper loaded in {time.time()-start_load:.2f}s")
         return True
     except Exception as e:
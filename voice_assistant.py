@@ -11,23 +11,137 @@ Architecture:
 """
 
 import os
-import sys
+
+# Thread pools read these once, when their library loads: set them before
+# numpy / onnxruntime / torch are imported (exported values still win)
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, "2")  # the two A76 cores
+os.environ.setdefault("OMP_WAIT_POLICY", "PASSIVE")  # don't spin between turns
+
 import time
-import wave
 import json
-import torch
 import re
 import pyaudio
 import numpy as np
 import collections
 import subprocess
 import gc
+import concurrent.futures
+import threading
 import webrtcvad
 from datetime import datetime
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-import concurrent.futures
+import functools
+import itertools
 import unicodedata
 
+# Optional dependencies, imported once: fuzzy matching and the RAM check
+# degrade gracefully without them
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Radxa Cubie A7A core layout (see optimize_system.py)
+A76_CORES = {0, 1}
+A55_CORES = {2, 3, 4, 5, 6, 7}
+
+# VA_DEBUG=1 prints per-turn diagnostics (corrections, transcription, intent)
+DEBUG = os.environ.get("VA_DEBUG") == "1"
+
+# Response text, normalized to NFC once so it matches the TTS audio cache
+HINDI_MONTHS = tuple(unicodedata.normalize('NFC', m) for m in (
+    'जनवरी', 'फ़रवरी', 'मार्च', 'अप्रैल', 'मई', 'जून',
+    'जुलाई', 'अगस्त', 'सितंबर', 'अक्टूबर', 'नवंबर', 'दिसंबर',
+))
+TIME_FORMAT = '%I:%M %p'
+
+STATIC_RESPONSES = {
+    intent: unicodedata.normalize('NFC', text) for intent, text in {
+        "hello": "नमस्ते! मेरा नाम भारत AI है, मैं आपकी कैसे मदद कर सकता हूं?",
+        "thank_you": "आपका स्वागत है!",
+        "help": "मैं जोक सुना सकता हूँ, संगीत बजा सकता हूँ और नाच भी सकता हूँ। समाचार और मौसम अभी ऑफलाइन हैं, लेकिन मैं समय और तारीख बता सकता हूँ। आप क्या जानना चाहते हैं?",
+        "stop": "ठीक है, बंद कर रहा हूं।",
+        "dance": "मैं नाच रहा हूं... धिन धिन धा! लेकिन मेरे पास पैर नहीं हैं!",
+        "weather": "मौसम की जानकारी उपलब्ध नहीं है। मैं ऑफलाइन काम करता हूं। लेकिन आज दिन अच्छा लग रहा है!",
+        "music": "गाना बजा रहा हूं... धुन धुन धु! वैसे मैं अभी स्पीकर से जुड़ा नहीं हूं।",
+        "news": "समाचार सेवा ऑफलाइन है। लेकिन आज का दिन बहुत अच्छा है!",
+    }.items()
+}
+UNKNOWN_RESPONSE = unicodedata.normalize('NFC', "माफ़ करें, मैं समझ नहीं पाया। कृपया फिर से बोलें।")
+JOKES = tuple(unicodedata.normalize('NFC', j) for j in (
+    "एक रोबोट डॉक्टर के पास गया। डॉक्टर बोला: आप तो बिल्कुल फिट हैं... बस थोड़ा ऑयल चाहिए!",
+    "मेरा एक दोस्त है, वह भी AI है। हम दोनों बहुत स्मार्ट हैं!",
+    "मजाक: मैंने एक बार कहा था मैं ऑफलाइन हूं, लेकिन कोई मान ही नहीं रहा था!",
+))
+
+
+@functools.lru_cache(maxsize=4)
+def clock_response(intent, second):
+    """Time/date reply for one epoch second (repeats within that second are cached)"""
+    now = datetime.fromtimestamp(second)
+    if intent == 'time':
+        return unicodedata.normalize('NFC', f"अभी समय है {now.strftime(TIME_FORMAT)}")
+    return unicodedata.normalize('NFC', f"आज की तारीख है {now.day} {HINDI_MONTHS[now.month - 1]} {now.year}")
+
+
+def pin_current_thread(cores):
+    """
+    Pin the calling thread to `cores`; threads it spawns afterwards
+    (ORT / CTranslate2 pools) inherit the mask. Returns the applied set,
+    or None if affinity is unsupported here.
+    """
+    cores = {c for c in cores if c < (os.cpu_count() or 1)}
+    if not cores:
+        return None
+    try:
+        os.sched_setaffinity(0, cores)
+        return cores
+    except (AttributeError, OSError):
+        return None
+
+
+def load_piper_voice(model_path, threads=4):
+    """
+    PiperVoice with a tuned ORT session. ORT's intra-op pool inherits the
+    calling thread's core affinity, so call this from the thread it should run on.
+    
+    4 threads, not the usual 2: the pool runs on the in-order A55 cores (about
+    half an A76 each), and 4 of the 6 leave two free for capture + VAD.
+    """
+    import onnxruntime as ort
+    from piper import PiperVoice
+    from piper.config import PiperConfig
+    
+    # Build the voice directly: PiperVoice.load() would create a default
+    # session first, doubling load time and peak RSS for the model
+    with open(f"{model_path}.json", "r", encoding="utf-8") as config_file:
+        config = PiperConfig.from_dict(json.load(config_file))
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    options.intra_op_num_threads = threads
+    options.inter_op_num_threads = 1
+    session = ort.InferenceSession(model_path, sess_options=options, providers=["CPUExecutionProvider"])
+    return PiperVoice(config=config, session=session)
+
+
+def piper_stream(voice, text):
+    """Yield raw int16 PCM per sentence from an in-process PiperVoice (piper-tts 1.2 and 1.3+ APIs)"""
+    if hasattr(voice, 'synthesize_stream_raw'):
+        yield from voice.synthesize_stream_raw(text)
+    else:
+        for chunk in voice.synthesize(text):
+            yield chunk.audio_int16_bytes
+
+
+def piper_synthesize(voice, text):
+    """Whole utterance as one int16 PCM buffer"""
+    return b''.join(piper_stream(voice, text))
+
 # ============================================================
 # LAYER 2: ADVANCED GRAMMAR CORRECTION
 # ============================================================
@@ -170,6 +284,41 @@ class AdvancedGrammarCorrector:
             (r'\bbatal\b', 'बताओ'), (r'\bbata\b', 'बताओ'),
         ]
         
+        # Fuse all rules into one alternation so Pass 1 is a single scan.
+        # The leftmost match in the text wins (not the earliest rule, as with
+        # one re.sub per rule): 'mujhe Gannna' hits \bmujhe\s+ganna\b before
+        # \bganna\b gets a chance. Rule order only breaks ties at the same
+        # start position.
+        # Consecutive plain \bword\b rules share one group + dict lookup.
+        literal_rule = re.compile(r'\\b([^\\()\[\]|?*+.{}^$]+)\\b')
+        groups, self.replacements = [], []
+        for pattern, replacement in self.error_patterns:
+            literal = literal_rule.fullmatch(pattern)
+            if literal and groups and isinstance(self.replacements[-1], dict):
+                groups[-1].append(literal.group(1))
+                self.replacements[-1].setdefault(literal.group(1).casefold(), replacement)
+            elif literal:
+                groups.append([literal.group(1)])
+                self.replacements.append({literal.group(1).casefold(): replacement})
+            else:
+                groups.append(pattern)
+                self.replacements.append(replacement)
+        self.literal_groups = groups
+        self.fused_pattern = re.compile(
+            '|'.join(
+                f'(?P<g{i}>\\b(?:{"|".join(group)})\\b)' if isinstance(group, list) else f'(?P<g{i}>{group})'
+                for i, group in enumerate(groups)
+            ),
+            flags=re.IGNORECASE
+        )
+        
+        # Cleanup patterns used on every utterance, compiled once
+        self.whitespace_pattern = re.compile(r'\s+')
+        self.noise_pattern = re.compile(
+            r'\b(umm|uh|hmm|aah|uhh|like|you know|bhujhey|mujee|aa|eh)\b', flags=re.IGNORECASE
+        )
+        self.repeat_pattern = re.compile(r'([a-zA-Z])\1{2,}')
+        
         # Heavy-Duty Perso-Arabic (Urdu) to Devanagari character mapping
         self.urdu_map = {
             '\u0622': 'आ', '\u0627': 'अ', '\u0628': 'ब', '\u067e': 'प', '\u062a': 'त', 
@@ -182,24 +331,23 @@ class AdvancedGrammarCorrector:
             '\u06be': 'ह', '\u06d2': 'ए', '\u06a4': 'व', '\u06cc': 'य', '\u064a': 'य',
             '\u0626': 'ए', '\u064b': 'न', '\u0621': 'इ', '\u0624': 'ओ'
         }
+        # Codepoint table for str.translate; unmapped Arabic-block chars are dropped
+        self.urdu_table = {cp: self.urdu_map.get(chr(cp)) or None for cp in range(0x0600, 0x0700)}
         
-        try:
-            from rapidfuzz import fuzz
-            self.fuzz = fuzz
-            self.use_fuzzy = True
-            self.fuzzy_threshold = 80
-        except ImportError:
-            self.use_fuzzy = False
+        # Flat vocabulary with lowercase forms precomputed once
+        self.vocab_words = [w for vocab_list in self.core_vocabulary.values() for w in vocab_list]
+        self.vocab_lower = [w.lower() for w in self.vocab_words]
+        self.vocab_lower_set = frozenset(self.vocab_lower)
+        
+        self.use_fuzzy = process is not None
+        self.fuzzy_threshold = 80
+        
+        # Per-instance LRU cache: repeated commands skip every correction pass
+        self.correct = functools.lru_cache(maxsize=128)(self.correct)
 
     def _transliterate_perso_arabic_to_devanagari(self, text):
         """Character-level conversion of Urdu script to Devanagari"""
-        result = []
-        for char in text:
-            if '\u0600' <= char <= '\u06FF':
-                result.append(self.urdu_map.get(char, ''))
-            else:
-                result.append(char)
-        return "".join(result)
+        return text.translate(self.urdu_table)
 
     def correct(self, text):
         if not text: return ""
@@ -209,63 +357,100 @@ class AdvancedGrammarCorrector:
         text = self._transliterate_perso_arabic_to_devanagari(text)
         
         # Pass 0.5: Normalize spaces (fixes "Sama Chhar" → "samachhar")
-        text = re.sub(r'\s+', ' ', text)  # Multiple spaces → single space
+        text = self.whitespace_pattern.sub(' ', text)  # Multiple spaces → single space
         text = text.strip()
         
         # Pass 0.75: Noise cleanup
-        noise_words = r'\b(umm|uh|hmm|aah|uhh|like|you know|bhujhey|mujee|aa|eh)\b'
-        text = re.sub(noise_words, '', text, flags=re.IGNORECASE)
-        text = re.sub(r'([a-zA-Z])\1{2,}', r'\1\1', text)  # "Gannna" → "Ganna"
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = self.noise_pattern.sub('', text)
+        text = self.repeat_pattern.sub(r'\1\1', text)  # "Gannna" → "Ganna"
+        text = self.whitespace_pattern.sub(' ', text).strip()
         
         # Pass 1: Regex patterns (Case-insensitive for Romanized parts)
-        corrected = text
-        for pattern, replacement in self.error_patterns:
-            corrected = re.sub(pattern, replacement, corrected, flags=re.IGNORECASE)
+        corrected = self.fused_pattern.sub(self._replace, text)
         
-        # Pass 2: Word-level fuzzy correction
-        words = corrected.split()
-        corrected_words = []
-        for word in words:
-            corrected_word = self._correct_word(word)
-            corrected_words.append(corrected_word)
+        # Pass 2: Word-level fuzzy correction (whole utterance in one call)
+        corrected_words = self._correct_words(corrected.split())
         
         final_text = ' '.join(corrected_words)
-        if final_text != original_text:
+        if DEBUG and final_text != original_text:
             print(f"✏️  Corrected: '{original_text}' → '{final_text}'")
         return final_text
     
-    def _correct_word(self, word):
-        if not self.use_fuzzy or len(word) < 2: return word
-        word_lower = word.lower()
-        
-        # Pass 1: Check for exact match first (Avoid over-correction like naacho -> naach)
-        for category, vocab_list in self.core_vocabulary.items():
-            for vocab_word in vocab_list:
-                if word_lower == vocab_word.lower():
-                    return word
-        
-        # Pass 2: Fuzzy matching only if no exact match found
-        best_match = word
-        best_score = 0
-        
-        for category, vocab_list in self.core_vocabulary.items():
-            for vocab_word in vocab_list:
-                similarity = self.fuzz.ratio(word_lower, vocab_word.lower())
-                if similarity > best_score:
-                    best_score = similarity
-                    best_match = vocab_word
-        
-        if best_score >= self.fuzzy_threshold:
-            return best_match
-            
-        return word
+    def _replace(self, match):
+        index = int(match.lastgroup[1:])
+        replacement = self.replacements[index]
+        if isinstance(replacement, dict):
+            word = match.group()
+            if word.casefold() in replacement:
+                return replacement[word.casefold()]
+            # IGNORECASE also matches Unicode case variants that casefold()
+            # maps elsewhere; find the literal the regex engine actually hit
+            for literal in self.literal_groups[index]:
+                if re.fullmatch(literal, word, flags=re.IGNORECASE):
+                    return replacement[literal.casefold()]
+            return word
+        return replacement
+    
+    def _correct_words(self, words):
+        if not self.use_fuzzy: return words
+        
+        # Pass 1: Exact vocabulary words are kept (Avoid over-correction like naacho -> naach)
+        pending = [i for i, w in enumerate(words) if len(w) >= 2 and w.lower() not in self.vocab_lower_set]
+        if not pending:
+            return words
+        
+        # Pass 2: Every remaining word against the vocabulary in one C++ call
+        scores = process.cdist(
+            [words[i].lower() for i in pending], self.vocab_lower,
+            scorer=fuzz.ratio, score_cutoff=self.fuzzy_threshold, dtype=np.float64
+        )
+        best = scores.argmax(axis=1)  # first max = same pick as extractOne
+        corrected = list(words)
+        for i, row, b in zip(pending, scores, best):
+            if row[b] >= self.fuzzy_threshold:
+                corrected[i] = self.vocab_words[b]
+        return corrected
 
 # ============================================================
 # LAYER 3: ROBUST INTENT CLASSIFICATION
 # ============================================================
 
+# Robust fallback keywords for 13 intents (dict order = intent priority)
+FALLBACK_PATTERNS = {
+    'stop': ('बंद', 'स्टॉप', 'stop', 'रुको', 'रूको', 'exit', 'quit', 'close', 'बन्द', 'समाप्त', 'खत्म', 'band', 'bantuja', 'अलविदा', 'अलवीदा', 'बाय', 'bye', 'टाटा', 'गुडबाय', 'alvida'),
+    'time': ('समय', 'टाइम', 'time', 'बजे', 'घड़ी', 'वक्त', 'घंटा', 'घंटे', 'samay', 'samai', 'time', 'samaya'),
+    'date': ('तारीख', 'तिथि', 'डेट', 'date', 'आज', 'दिन', 'कैलेंडर', 'tariq', 'tarikh', 'tithi', 'din'),
+    'hello': ('नमस्ते', 'नमस्कार', 'हैलो', 'हेलो', 'hello', 'hi', 'हाय', 'प्रणाम', 'namaste', 'naam', 'name', 'नाम'),
+    'thank_you': ('धन्यवाद', 'शुक्रिया', 'thanks', 'thank', 'थैंक', 'आभार', 'शुक्रीया', 'shukriya', 'जुक्रिया', 'जुप्रिया'),
+    'help': ('मदद', 'हेल्प', 'help', 'सहायता', 'सहायत', 'madad'),
+    'dance': ('नाच', 'dance', 'नाचो', 'डांस', 'दिकार', 'तिकाओ', 'दिखाओ'),
+    'weather': ('मौसम', 'weather', 'बारिश' ,'ठंड', 'गर्मी', 'तापमान', 'viter', 'wither', 'vether', 'batal'),
+    'joke': ('जोक', 'joke', 'मजाक', 'हँसाओ', 'funny', 'चुटकुला', 'कॉमेडी', 'जुक्र', 'जुक्रा'),
+    'music': ('गाना', 'संगीत', 'music', 'song', 'बजाओ', 'चलाओ', 'play', 'ganna', 'gana', 'kanna', 'kana', 'sunao', 'suna', 'बंदानाओ', 'बंदाना', 'बजा', 'bajao', 'बंदाओ', 'काना', 'पदाओ'),
+    'news': ('समाचार', 'न्यूज़', 'news', ' खबर', 'headlines', 'अपडेट', 'chhar', 'char', 'चार', 'चर', 'samachhar', 'समजार', 'समाद्यार'),
+}
+
+# One ORT session per model file for the whole process
+_ORT_SESSIONS = {}
+
+
 class RobustIntentClassifier:
+    # Utterances are short; inputs are padded to 16/32/48/64 tokens
+    MAX_TOKENS = 64
+    PAD_BUCKET = 16
+    
+    # Stage 0 keyword guardrails, checked in order (first hit wins)
+    GUARDRAILS = (
+        ("date", frozenset({'दिन', 'तारीख', 'तिथि', 'date', 'तारीक'})),
+        ("music", frozenset({'बजाओ', 'बंदानाओ', 'बंदाना', 'गाना', 'संगीत', 'music', 'song', 'बजा', 'बंदाओ', 'काना', 'पदाओ'})),
+        ("joke", frozenset({'जोक', 'joke', 'मजाक', 'चुटकुला', 'जुक्र', 'जुक्रा'})),
+        ("thank_you", frozenset({'धन्यवाद', 'शुक्रिया', 'thx', 'thanks', 'जुक्रिया'})),
+        ("news", frozenset({'समाद्यार', 'समाचार', 'news', 'खबर', 'न्यूज़', 'समजार'})),
+        ("dance", frozenset({'नाच', 'नाचो', 'डांस', 'दिकार', 'तिकाओ'})),
+    )
+    # Stop sanity check: substrings that still count inside compound words
+    STOP_SUBSTRINGS = ('बंद', 'रुको', 'stop', 'exit')
+    
     def __init__(self, model_path=None, use_onnx=True):
         """
         Initialize intent classifier with ONNX optimization
@@ -275,85 +460,185 @@ class RobustIntentClassifier:
             script_dir = os.path.dirname(os.path.abspath(__file__))
             model_path = os.path.join(script_dir, 'hindi_intent_model_final')
         
+        # Per-instance LRU cache: repeated commands skip tokenize + forward
+        self._predict = functools.lru_cache(maxsize=256)(self._predict)
+        self._classify = functools.lru_cache(maxsize=256)(self._classify)
+        
+        # Preprocessing patterns, compiled once (punctuation + Urdu residue fused:
+        # deleting single characters is order-independent)
+        self.strip_chars_pattern = re.compile(r'[.,!?।|\u0600-\u06FF]')
+        self.filler_pattern = re.compile(r'(?i)\b(teeke|theke|thek|tik|ok|hlo|hey)\b')
+        
         # Check for ONNX model
         onnx_path = model_path.replace('_final', '_onnx_int8')
         
+        loaded = False
         if use_onnx and os.path.exists(onnx_path):
             print(f"⚙️  Loading ONNX-optimized classifier from {os.path.basename(onnx_path)}...")
             try:
                 self._load_onnx_model(onnx_path)
-                return  # Success, skip PyTorch loading
+                loaded = True  # Success, skip PyTorch loading
             except Exception as e:
                 print(f"⚠️  ONNX loading failed: {e}")
                 print(f"   Falling back to PyTorch model...")
         
-        # Load PyTorch model (original or fallback)
-        if use_onnx and not os.path.exists(onnx_path):
-            print(f"ℹ️  ONNX model not found at {os.path.basename(onnx_path)}")
-            print(f"   Using PyTorch model (run convert_indicbert_to_onnx.py to optimize)")
+        if not loaded:
+            # Load PyTorch model (original or fallback)
+            if use_onnx and not os.path.exists(onnx_path):
+                print(f"ℹ️  ONNX model not found at {os.path.basename(onnx_path)}")
+                print(f"   Using PyTorch model (run convert_indicbert_to_onnx.py to optimize)")
+            
+            print(f"⚙️  Loading PyTorch classifier from {os.path.basename(model_path)}...")
+            self._load_pytorch_model(model_path)
+        
+        # Flatten fallback keywords once; list order = intent priority
+        self.fallback_keywords = [
+            (intent, kw.lower()) for intent, keywords in FALLBACK_PATTERNS.items() for kw in keywords
+        ]
+        # keyword -> position of its first (highest-priority) occurrence
+        self.keyword_rank = {}
+        for rank, (_, kw) in enumerate(self.fallback_keywords):
+            self.keyword_rank.setdefault(kw, rank)
+        # Ignore very short keywords for fuzzy matching to avoid "hi" in "abhi"
+        fuzzy = [(intent, kw) for intent, kw in self.fallback_keywords if len(kw) >= 3]
+        self.fuzzy_intents = [intent for intent, _ in fuzzy]
+        self.fuzzy_keywords = [kw for _, kw in fuzzy]
         
-        print(f"⚙️  Loading PyTorch classifier from {os.path.basename(model_path)}...")
-        self._load_pytorch_model(model_path)
+        # Keyword shortlist resolved without BERT. Stop words stay with
+        # BERT + the stop sanity check (avoids accidental exits), and everyday
+        # words that merely appear in a keyword list are left out.
+        ambiguous = {'आज', 'नाम', 'naam', 'name', 'चार', 'चर', 'char', 'suna'}
+        self.exact_intent = {}
+        for intent, kw in self.fallback_keywords:
+            if intent != 'stop' and kw not in ambiguous:
+                self.exact_intent.setdefault(kw, intent)
+        self.stop_keywords = frozenset(kw for intent, kw in self.fallback_keywords if intent == 'stop')
 
     def _load_onnx_model(self, model_path):
         """Load ONNX-optimized model"""
         import os
         import json
-        import torch
-        from optimum.onnxruntime import ORTModelForSequenceClassification
+        import onnxruntime as ort
         
-        # Load label map
-        with open(os.path.join(model_path, 'label_map.json'), 'r') as f:
-            self.id2label = json.load(f)['id2label']
+        # Prefer the ARM64 INT8 graph written by convert_indicbert_to_onnx.py
+        file_name = "model_quantized.onnx"
+        if not os.path.exists(os.path.join(model_path, file_name)):
+            file_name = "model.onnx"
         
-        # Load tokenizer and model
-        self.tokenizer = AutoTokenizer.from_pretrained(model_path)
-        self.model = ORTModelForSequenceClassification.from_pretrained(
-            model_path,
-            provider="CPUExecutionProvider"
-        )
+        # Two intra-op threads = the two Cortex-A76 big cores
+        sess_options = ort.SessionOptions()
+        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        sess_options.intra_op_num_threads = 2
+        sess_options.inter_op_num_threads = 1  # sequential mode: no inter-op pool
+        sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        sess_options.add_session_config_entry("session.set_denormal_as_zero", "1")
+        # Smaller dynamic work blocks: the two big cores split short GEMMs evenly
+        sess_options.add_session_config_entry("session.dynamic_block_base", "4")
+        # No arena / memory-pattern planning: lower peak RSS next to Whisper + Piper
+        sess_options.enable_cpu_mem_arena = False
+        sess_options.enable_mem_pattern = False
         
-        self.device = torch.device("cpu")
+        # Load tokenizer and raw ORT session (no PyTorch in the inference path)
+        self._load_onnx_tokenizer(model_path)
+        model_file = os.path.join(model_path, file_name)
+        if model_file not in _ORT_SESSIONS:
+            _ORT_SESSIONS[model_file] = ort.InferenceSession(
+                model_file,
+                sess_options,
+                providers=["CPUExecutionProvider"]
+            )
+        self.session = _ORT_SESSIONS[model_file]
+        self.onnx_inputs = {i.name for i in self.session.get_inputs()}
         self.model_type = "onnx"
         
-        print("   ✓ ONNX INT8 model loaded")
+        # Labels are embedded in the graph metadata by the converter
+        metadata = self.session.get_modelmeta().custom_metadata_map
+        if 'id2label' in metadata:
+            self.id2label = json.loads(metadata['id2label'])
+        else:
+            with open(os.path.join(model_path, 'label_map.json'), 'r') as f:
+                self.id2label = json.load(f)['id2label']
         
-        # Pin to A76 cores (Cubie A7A optimization)
-        try:
-            import psutil
-            p = psutil.Process()
-            p.cpu_affinity([0, 1])  # Cores 0-1 are Cortex-A76
-            print("   ✓ Process pinned to Cortex-A76 cores")
-        except Exception:
-            pass  # Not critical
-        
-        # Set thread limits for 6GB RAM
-        os.environ['OMP_NUM_THREADS'] = '2'
-        torch.set_num_threads(2)
+        # Warm each padding bucket once so MatMul packing happens at load time
+        for length in range(self.PAD_BUCKET, self.MAX_TOKENS + 1, self.PAD_BUCKET):
+            warm = {name: np.zeros((1, length), dtype=np.int64) for name in self.onnx_inputs}
+            if 'attention_mask' in warm:
+                warm['attention_mask'][:] = 1
+            self.session.run(None, warm)
         
-        # Robust fallback keywords for 13 intents
-        self.fallback_patterns = {
-            'stop': ['बंद', 'स्टॉप', 'stop', 'रुको', 'रूको', 'exit', 'quit', 'close', 'बन्द', 'समाप्त', 'खत्म', 'band', 'bantuja', 'अलविदा', 'अलवीदा', 'बाय', 'bye', 'टाटा', 'गुडबाय', 'alvida'],
-            'time': ['समय', 'टाइम', 'time', 'बजे', 'घड़ी', 'वक्त', 'घंटा', 'घंटे', 'samay', 'samai', 'time', 'samaya'],
-            'date': ['तारीख', 'तिथि', 'डेट', 'date', 'आज', 'दिन', 'कैलेंडर', 'tariq', 'tarikh', 'tithi', 'din'],
-            'hello': ['नमस्ते', 'नमस्कार', 'हैलो', 'हेलो', 'hello', 'hi', 'हाय', 'प्रणाम', 'namaste', 'naam', 'name', 'नाम'],
-            'thank_you': ['धन्यवाद', 'शुक्रिया', 'thanks', 'thank', 'थैंक', 'आभार', 'शुक्रीया', 'shukriya', 'जुक्रिया', 'जुप्रिया'],
-            'help': ['मदद', 'हेल्प', 'help', 'सहायता', 'सहायत', 'madad'],
-            'dance': ['नाच', 'dance', 'नाचो', 'डांस', 'दिकार', 'तिकाओ', 'दिखाओ'],
-            'weather': ['मौसम', 'weather', 'बारिश' ,'ठंड', 'गर्मी', 'तापमान', 'viter', 'wither', 'vether', 'batal'],
-            'joke': ['जोक', 'joke', 'मजाक', 'हँसाओ', 'funny', 'चुटकुला', 'कॉमेडी', 'जुक्र', 'जुक्रा'],
-            'music': ['गाना', 'संगीत', 'music', 'song', 'बजाओ', 'चलाओ', 'play', 'ganna', 'gana', 'kanna', 'kana', 'sunao', 'suna', 'बंदानाओ', 'बंदाना', 'बजा', 'bajao', 'बंदाओ'],
-            'news': ['समाचार', 'न्यूज़', 'news', ' खबर', 'headlines', 'अपडेट', 'chhar', 'char', 'चार', 'चर', 'samachhar', 'समजार', 'समाद्यार'],
-        }
+        print("   ✓ ONNX INT8 model loaded")
 
+    def _load_onnx_tokenizer(self, model_path):
+        """
+        Load the Rust tokenizer straight from tokenizer.json.
+        Importing transformers would also pull in torch (~200 MB RSS).
+        """
+        tokenizer_file = os.path.join(model_path, 'tokenizer.json')
+        if os.path.exists(tokenizer_file):
+            from tokenizers import Tokenizer
+            self.tokenizer = Tokenizer.from_file(tokenizer_file)
+            
+            # IndicBERT (ALBERT) pads with <pad>, BERT exports with [PAD]
+            pad_token = None
+            for config_name in ('special_tokens_map.json', 'tokenizer_config.json'):
+                config_file = os.path.join(model_path, config_name)
+                if pad_token is None and os.path.exists(config_file):
+                    with open(config_file, 'r') as f:
+                        pad_token = json.load(f).get('pad_token')
+                    if isinstance(pad_token, dict):
+                        pad_token = pad_token['content']
+            pad_token = pad_token or "[PAD]"
+            pad_id = self.tokenizer.token_to_id(pad_token)
+        else:
+            # Older export without tokenizer.json: convert once via transformers
+            from transformers import AutoTokenizer
+            hf_tokenizer = AutoTokenizer.from_pretrained(model_path, use_fast=True)
+            if not hf_tokenizer.is_fast:
+                raise RuntimeError("fast tokenizer unavailable for ONNX model")
+            self.tokenizer = hf_tokenizer.backend_tokenizer
+            pad_token, pad_id = hf_tokenizer.pad_token, hf_tokenizer.pad_token_id
+        if pad_id is None:
+            raise ValueError(f"pad token {pad_token!r} not found in the {model_path} tokenizer vocabulary")
+        
+        # Pad up to a multiple of 16 tokens: ORT only ever sees 4 input shapes
+        self.tokenizer.enable_truncation(max_length=self.MAX_TOKENS)
+        self.tokenizer.enable_padding(pad_id=pad_id, pad_token=pad_token, pad_to_multiple_of=self.PAD_BUCKET)
+        
+        # First call builds lazy normalizer/pre-tokenizer state
+        self.tokenizer.encode("नमस्ते warmup")
+    
+    def _load_tokenizer(self, model_path):
+        """Load the Rust-backed fast tokenizer and warm it up"""
+        from transformers import AutoTokenizer, PreTrainedTokenizerFast
+        self.tokenizer = AutoTokenizer.from_pretrained(model_path, use_fast=True)
+        if not isinstance(self.tokenizer, PreTrainedTokenizerFast):
+            print("   ⚠️  Fast tokenizer unavailable, using slow Python tokenizer")
+        
+        # First call builds lazy normalizer/pre-tokenizer state
+        self.tokenizer("नमस्ते warmup", max_length=self.MAX_TOKENS, truncation=True)
+    
     def _load_pytorch_model(self, model_path):
         """Load original PyTorch model (fallback)"""
+        # torch is only imported when the ONNX model is unavailable
+        import torch
+        from transformers import AutoModelForSequenceClassification
+        
+        # Inference only: A76 pair for the math, no inter-op pool, static-shape
+        # fusion for the per-bucket traced graphs
+        torch.set_num_threads(2)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass  # already fixed once a parallel op has run
+        torch.jit.set_fusion_strategy([("STATIC", 20)])
+        
         with open(os.path.join(model_path, 'label_map.json'), 'r') as f:
             self.id2label = json.load(f)['id2label']
         
-        self.tokenizer = AutoTokenizer.from_pretrained(model_path)
+        self._load_tokenizer(model_path)
         self.model = AutoModelForSequenceClassification.from_pretrained(
-            model_path
+            model_path,
+            torchscript=True  # tuple outputs, so the model can be traced
         )
         self.model.eval()
         self.device = torch.device("cpu")
@@ -362,65 +647,111 @@ class RobustIntentClassifier:
         
         print("   ✓ PyTorch float32 model loaded")
         
-        # Keep fallback patterns (add them here too)
-        self.fallback_patterns = {
-            'stop': ['बंद', 'स्टॉप', 'stop', 'रुको', 'रूको', 'exit', 'quit', 'close', 'बन्द', 'समाप्त', 'खत्म', 'band', 'bantuja', 'अलविदा', 'अलवीदा', 'बाय', 'bye', 'टाटा', 'गुडबाय', 'alvida'],
-            'time': ['समय', 'टाइम', 'time', 'बजे', 'घड़ी', 'वक्त', 'घंटा', 'घंटे', 'samay', 'samai', 'time', 'samaya'],
-            'date': ['तारीख', 'तिथि', 'डेट', 'date', 'आज', 'दिन', 'कैलेंडर', 'tariq', 'tarikh', 'tithi', 'din'],
-            'hello': ['नमस्ते', 'नमस्कार', 'हैलो', 'हेलो', 'hello', 'hi', 'हाय', 'प्रणाम', 'namaste', 'naam', 'name', 'नाम'],
-            'thank_you': ['धन्यवाद', 'शुक्रिया', 'thanks', 'thank', 'थैंक', 'आभार', 'शुक्रीया', 'shukriya', 'जुक्रिया', 'जुप्रिया'],
-            'help': ['मदद', 'हेल्प', 'help', 'सहायता', 'सहायत', 'madad'],
-            'dance': ['नाच', 'dance', 'नाचो', 'डांस', 'दिकार', 'तिकाओ', 'दिखाओ'],
-            'weather': ['मौसम', 'weather', 'बारिश' ,'ठंड', 'गर्मी', 'तापमान', 'viter', 'wither', 'vether', 'batal'],
-            'joke': ['जोक', 'joke', 'मजाक', 'हँसाओ', 'funny', 'चुटकुला', 'कॉमेडी', 'जुक्र', 'जुक्रा'],
-            'music': ['गाना', 'संगीत', 'music', 'song', 'बजाओ', 'चलाओ', 'play', 'ganna', 'gana', 'kanna', 'kana', 'sunao', 'suna', 'बंदानाओ', 'बंदाना', 'बजा', 'bajao', 'बंदाओ', 'काना', 'पदाओ'],
-            'news': ['समाचार', 'न्यूज़', 'news', ' खबर', 'headlines', 'अपडेट', 'chhar', 'char', 'चार', 'चर', 'samachhar', 'समजार', 'समाद्यार'],
-        }
+        # INT8 weights for every nn.Linear (the bulk of BERT's parameters);
+        # activations are quantized per call, only the argmax is consumed
+        try:
+            # ARM: QNNPACK kernels (fbgemm is x86-only); must be set before packing weights
+            if os.uname().machine in ('aarch64', 'arm64') and 'qnnpack' in torch.backends.quantized.supported_engines:
+                torch.backends.quantized.engine = 'qnnpack'
+            self.model = torch.ao.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            self.model.eval()
+            print("   ✓ Linear layers quantized to INT8 (dynamic)")
+        except Exception as e:
+            print(f"   ⚠️  INT8 quantization skipped: {e}")
+        
+        # TorchScript graph per padding bucket: static shapes, no eager dispatch
+        self.traced = {}
+        try:
+            import warnings
+            with torch.no_grad(), warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # TracerWarnings about constant masks, jit deprecations
+                for length in range(self.PAD_BUCKET, self.MAX_TOKENS + 1, self.PAD_BUCKET):
+                    input_ids = torch.zeros((1, length), dtype=torch.long)
+                    attention_mask = torch.ones((1, length), dtype=torch.long)
+                    self.traced[length] = torch.jit.trace(self.model, (input_ids, attention_mask))
+                print("   ✓ TorchScript traced (16/32/48/64 tokens)")
+                # Freeze + inference fusions (constant-folded weights, fused ops)
+                try:
+                    self.traced = {n: torch.jit.optimize_for_inference(m) for n, m in self.traced.items()}
+                    print("   ✓ TorchScript optimized for inference")
+                except Exception as e:
+                    print(f"   ⚠️  optimize_for_inference skipped: {e}")
+        except Exception as e:
+            self.traced = {}
+            print(f"   ⚠️  Tracing failed, using eager model: {e}")
 
     def classify(self, text):
+        # NFC first: equivalent spellings share a cache entry and match the keyword lists
+        return self._classify(unicodedata.normalize('NFC', text))
+    
+    def _classify(self, text):
         if not text.strip(): return "unknown", 0.0
         
-        # Robust Pre-processing (Strip punctuation, Urdu script residue, and Noise)
-        text = re.sub(r'[.,!?।|]', '', text).strip()
-        # Strip remaining Urdu/Arabic characters if any leaked
-        text = re.sub(r'[\u0600-\u06FF]', '', text).strip()
-        text = re.sub(r'(?i)\b(teeke|theke|thek|tik|ok|hlo|hey)\b', '', text).strip()
+        text = self._preprocess(text)
+        # Lowercase + split once; every later stage reuses them
+        text_lower = text.lower()
+        words = set(text_lower.split())
+        guarded = self._keyword_guardrails(words)
+        if guarded:
+            return guarded
         
+        # Stage 1: IndicBERT
+        idx, confidence = self._predict(text)
+        return self._resolve(text_lower, words, idx, confidence)
+    
+    def classify_batch(self, texts):
+        """Classify many utterances with a single batched forward pass"""
+        results = [None] * len(texts)
+        pending = []
+        for i, text in enumerate(texts):
+            if not text.strip():
+                results[i] = ("unknown", 0.0)
+                continue
+            text = self._preprocess(unicodedata.normalize('NFC', text))
+            text_lower = text.lower()
+            words = set(text_lower.split())
+            results[i] = self._keyword_guardrails(words)
+            if not results[i]:
+                pending.append((i, text, text_lower, words))
+        
+        if pending:
+            predictions = self._predict_batch([text for _, text, _, _ in pending])
+            for (i, _, text_lower, words), (idx, confidence) in zip(pending, predictions):
+                results[i] = self._resolve(text_lower, words, idx, confidence)
+        return results
+    
+    def _preprocess(self, text):
+        # Robust Pre-processing (Strip punctuation, Urdu script residue, and Noise)
+        text = self.strip_chars_pattern.sub('', text)
+        text = self.filler_pattern.sub('', text).strip()
+        return text
+    
+    def _keyword_guardrails(self, words):
         # Stage 0: Keyword Guardrails (Hard override for absolute clarity)
-        words = set(text.lower().split())
-        if any(w in words for w in ['दिन', 'तारीख', 'तिथि', 'date', 'तारीक']):
-            return "date", 0.99
-        if any(w in words for w in ['बजाओ', 'बंदानाओ', 'बंदाना', 'गाना', 'संगीत', 'music', 'song', 'बजा', 'बंदाओ', 'काना', 'पदाओ']):
-            return "music", 0.99
-        if any(w in words for w in ['जोक', 'joke', 'मजाक', 'चुटकुला', 'जुक्र', 'जुक्रा']):
-            return "joke", 0.99
-        if any(w in words for w in ['धन्यवाद', 'शुक्रिया', 'thx', 'thanks', 'जुक्रिया']):
-            return "thank_you", 0.99
-        if any(w in words for w in ['समाद्यार', 'समाचार', 'news', 'खबर', 'न्यूज़', 'समजार']):
-            return "news", 0.99
-        if any(w in words for w in ['नाच', 'नाचो', 'डांस', 'दिकार', 'तिकाओ']):
-            return "dance", 0.99
+        for intent, keywords in self.GUARDRAILS:
+            if not words.isdisjoint(keywords):
+                return intent, 0.99
         
-        # Stage 1: IndicBERT
-        inputs = self.tokenizer(text, return_tensors="pt", max_length=64, truncation=True, padding=True).to(self.device)
-        with torch.no_grad():
-            outputs = self.model(**inputs)
-            probs = torch.nn.functional.softmax(outputs.logits, dim=-1)
-            conf, idx = torch.max(probs, dim=-1)
-            
-        intent = self.id2label.get(str(idx.item()), "unknown")
-        confidence = conf.item()
+        # Keyword shortlist: every hit names the same intent and no stop
+        # word is present -> skip BERT entirely
+        intents = {self.exact_intent[w] for w in words & self.exact_intent.keys()}
+        if len(intents) == 1 and not words & self.stop_keywords:
+            return intents.pop(), (0.99 if len(words) == 1 else 0.95)
+        return None
+    
+    def _resolve(self, text_lower, words, idx, confidence):
+        intent = self.id2label.get(str(idx), "unknown")
         
         if confidence >= 0.82:
             # Stage 2: Stop Intent Sanity Check (Prevention of accidental exits)
             if intent == "stop":
-                text_lower = text.lower()
-                words = set(text_lower.split())
                 # Must contain a stop keyword OR have extreme confidence
-                has_stop_word = any(kw.lower() in words for kw in self.fallback_patterns['stop'])
+                has_stop_word = not words.isdisjoint(self.stop_keywords)
                 # Also check for substring match for compound Hindi phrases
                 if not has_stop_word:
-                    has_stop_word = any(kw.lower() in text_lower for kw in ['बंद', 'रुको', 'stop', 'exit'])
+                    has_stop_word = any(kw in text_lower for kw in self.STOP_SUBSTRINGS)
                 
                 if not has_stop_word and confidence < 0.97:
                     print(f"⚠️  Stop intent rejected (no keyword match). Conf: {confidence:.2f}")
@@ -429,40 +760,63 @@ class RobustIntentClassifier:
             return intent, confidence
             
         # Try fuzzy fallback for EVERYTHING else
-        fallback_intent = self._fuzzy_fallback(text)
+        fallback_intent = self._fuzzy_fallback(text_lower, words)
         if fallback_intent:
-            print(f"✓ Fuzzy fallback matched: {fallback_intent}")
+            if DEBUG:
+                print(f"✓ Fuzzy fallback matched: {fallback_intent}")
             return fallback_intent, 0.90
             
         return "unknown", confidence
-
-    def _fuzzy_fallback(self, text):
-        from rapidfuzz import fuzz
-        text_lower = text.lower()
+    
+    def _predict(self, text):
+        """Tokenize + forward pass, returns (label index, confidence)"""
+        return self._predict_batch([text])[0]
+    
+    def _predict_batch(self, texts):
+        """Batched tokenize + forward pass, returns [(label index, confidence), ...]"""
+        if self.model_type == "onnx":
+            encodings = self.tokenizer.encode_batch(texts)
+            inputs = {
+                'input_ids': [e.ids for e in encodings],
+                'attention_mask': [e.attention_mask for e in encodings],
+                'token_type_ids': [e.type_ids for e in encodings],
+            }
+            feed = {k: np.array(v, dtype=np.int64) for k, v in inputs.items() if k in self.onnx_inputs}
+            logits = self.session.run(None, feed)[0]
+        else:
+            import torch
+            inputs = self.tokenizer(
+                texts, return_tensors="pt", max_length=self.MAX_TOKENS, truncation=True,
+                padding=True, pad_to_multiple_of=self.PAD_BUCKET
+            )
+            # Single-segment input: token_type_ids are all zeros, the model default
+            model = self.traced.get(inputs['input_ids'].shape[1], self.model)
+            with torch.inference_mode():
+                logits = model(inputs['input_ids'], inputs['attention_mask'])[0].cpu().numpy()
         
+        # argmax(softmax(x)) == argmax(x); only the winner's probability is needed
+        idx = logits.argmax(axis=-1)
+        winners = logits[np.arange(len(texts)), idx][:, None]
+        confidence = 1.0 / np.exp(logits - winners).sum(axis=-1)
+        return [(int(i), float(c)) for i, c in zip(idx, confidence)]
+
+    def _fuzzy_fallback(self, text_lower, words):
         # Pass 1: Local token-based presence (Strict)
-        words = set(text_lower.split())
-        for intent, keywords in self.fallback_patterns.items():
-            for kw in keywords:
-                if kw.lower() in words:
-                    return intent
+        hits = words & self.keyword_rank.keys()
+        if hits:
+            return self.fallback_keywords[min(self.keyword_rank[kw] for kw in hits)][0]
                     
-        # Pass 2: Fuzzy Set Ratio (with safety checks)
-        scores = {}
-        for intent, keywords in self.fallback_patterns.items():
-            max_score = 0
-            for kw in keywords:
-                # Ignore very short keywords for fuzzy matching to avoid "hi" in "abhi"
-                if len(kw) < 3: continue 
-                
-                score = fuzz.token_set_ratio(text_lower, kw.lower())
-                max_score = max(max_score, score)
-            scores[intent] = max_score
-            
-        if scores:
-            best_intent = max(scores, key=scores.get)
-            if scores[best_intent] >= 80:
-                return best_intent
+        if process is None:
+            return None
+        
+        # Pass 2: Fuzzy Set Ratio against every keyword in one C++ call
+        # (score_cutoff lets rapidfuzz skip keywords that can't reach 80)
+        match = process.extractOne(
+            text_lower, self.fuzzy_keywords,
+            scorer=fuzz.token_set_ratio, score_cutoff=80
+        )
+        if match:
+            return self.fuzzy_intents[match[2]]  # first best = first intent in priority order
             
         return None
 
@@ -474,23 +828,22 @@ class RobustIntentClassifier:
 class RealtimeVoiceAssistant:
     def _check_memory_safety(self):
         """Ensure sufficient RAM for 6GB system"""
-        try:
-            import psutil
-            mem = psutil.virtual_memory()
-            
-            free_gb = mem.available / (1024**3)
-            total_gb = mem.total / (1024**3)
-            
-            print(f"💾 Memory: {free_gb:.1f}GB free / {total_gb:.1f}GB total")
-            
-            if mem.available < 2.5 * 1024**3:  # Less than 2.5GB free
-                print("⚠️  WARNING: Low memory!")
-                print(f"   Available: {free_gb:.1f}GB")
-                print(f"   Recommended: 2.5GB minimum")
-                print("   Close other applications for best performance.")
-            
-        except ImportError:
+        if psutil is None:
             print("⚠️  psutil not installed (pip install psutil)")
+            return
+        
+        mem = psutil.virtual_memory()
+        
+        free_gb = mem.available / (1024**3)
+        total_gb = mem.total / (1024**3)
+        
+        print(f"💾 Memory: {free_gb:.1f}GB free / {total_gb:.1f}GB total")
+        
+        if mem.available < 2.5 * 1024**3:  # Less than 2.5GB free
+            print("⚠️  WARNING: Low memory!")
+            print(f"   Available: {free_gb:.1f}GB")
+            print(f"   Recommended: 2.5GB minimum")
+            print("   Close other applications for best performance.")
 
     def __init__(self):
         # Memory safety check
@@ -507,12 +860,22 @@ class RealtimeVoiceAssistant:
         self.CHANNELS = 1
         
         self.vad = webrtcvad.Vad(2) 
+        self.noise_calibration_frames = 10  # first 300 ms of each listen = ambient floor
         self.silence_threshold = 1.0 
+        self.speculative_silence = 0.6  # start ASR this far into the end-of-speech pause
         self.min_speech_duration = 0.5 
         self.max_recording_duration = 6.0  # Shorter = less noise accumulation
+        # Reused capture buffer: max duration + pre-roll ring + one frame of int16 samples
+        self.record_buffer = bytearray(int(self.max_recording_duration * self.RATE + 12 * self.CHUNK) * 2)
         
         self.audio = pyaudio.PyAudio()
+        # Opened once; record_with_vad only starts/stops it
+        self.input_stream = self.audio.open(format=self.FORMAT, channels=self.CHANNELS,
+                                            rate=self.RATE, input=True,
+                                            frames_per_buffer=self.CHUNK, start=False)
         
+        # Whisper + BERT thread pools are created below; pin first so they stay on A76
+        pin_current_thread(A76_CORES)
         
         # Layer 1: ASR Loading (Faster-Whisper with Fallback)
         try:
@@ -527,124 +890,176 @@ class RealtimeVoiceAssistant:
             )
             self.use_faster_whisper = True
             print("✓ Faster-Whisper loaded (optimized for SBC)")
+            
+            # Warm-up decode on 1 s of silence so the first turn doesn't pay for
+            # kernel selection / buffer allocation (vad_filter off: it would skip it)
+            try:
+                segments, _ = self.asr_model.transcribe(
+                    np.zeros(self.RATE, dtype=np.float32),
+                    beam_size=3, language="hi", vad_filter=False,
+                    condition_on_previous_text=False, without_timestamps=True
+                )
+                for _ in segments:  # segments decode lazily
+                    pass
+                print("✓ Faster-Whisper warmed up")
+            except Exception as e:
+                print(f"⚠️  ASR warm-up skipped: {e}")
         except Exception as e:
             print(f"⚠️  Faster-Whisper failed: {e}")
             print("   Falling back to standard Whisper (will be slower)")
             import whisper
             self.asr_standard = whisper.load_model("base")
             self.use_faster_whisper = False
-            
-        self.TEMP_WAV = "temp_input.wav"
         
         # Layer 2: Advanced Grammar Corrector
         print("\n[Layer 2] Initializing Advanced Grammar Corrector...")
         self.corrector = AdvancedGrammarCorrector()
         
+        # Single worker for speculative correction + intent on ASR partials,
+        # pinned to the A76 pair like the ASR worker below
+        self.nlu_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, initializer=pin_current_thread, initargs=(A76_CORES,)
+        )
+        
         # Layer 3: Robust Intent Classifier
+        # Built on the NLU worker so ORT's intra-op pool inherits its A76 mask
         print("\n[Layer 3] Loading Robust Intent Classifier...")
-        self.intent_classifier = RobustIntentClassifier()
+        self.intent_classifier = self.nlu_executor.submit(RobustIntentClassifier).result()
+        # ASR worker on the A76 pair: transcription can start while the
+        # A55-side capture is still waiting out the silence tail
+        self.asr_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, initializer=pin_current_thread, initargs=(A76_CORES,)
+        )
         
         # TTS Settings
         script_dir = os.path.dirname(os.path.abspath(__file__))
         self.piper_model = os.path.join(script_dir, "models/hindi/hi_IN-rohan-medium.onnx")
         self.piper_sample_rate = 22050
         
-        # Pre-cache ALL static responses for instant playback (Parallel)
-        print("\n[TTS] Pre-generating all static responses (Parallel 2-workers)...")
-        self.audio_cache = {}
-        
-        # Static responses that never change - Normalized to NFC
-        raw_responses = [
-            "ठीक है, बंद कर रहा हूं।",
-            "नमस्ते! मेरा नाम भारत AI है, मैं आपकी कैसे मदद कर सकता हूं?",
-            "आपका स्वागत है!",
-            "मैं जोक सुना सकता हूँ, संगीत बजा सकता हूँ और नाच भी सकता हूँ। समाचार और मौसम अभी ऑफलाइन हैं, लेकिन मैं समय और तारीख बता सकता हूँ। आप क्या जानना चाहते हैं?",
-            "माफ़ करें, मैं समझ नहीं पाया। कृपया फिर से बोलें।",
-            "मौसम की जानकारी उपलब्ध नहीं है। मैं ऑफलाइन काम करता हूं। लेकिन आज दिन अच्छा लग रहा है!",
-            "गाना बजा रहा हूं... धुन धुन धु! वैसे मैं अभी स्पीकर से जुड़ा नहीं हूं।",
-            "समाचार सेवा ऑफलाइन है। लेकिन आज का दिन बहुत अच्छा है!",
-            "मैं नाच रहा हूं... धिन धिन धा! लेकिन मेरे पास पैर नहीं हैं!",
-            "एक रोबोट डॉक्टर के पास गया। डॉक्टर बोला: आप तो बिल्कुल फिट हैं... बस थोड़ा ऑयल चाहिए!",
-            "मेरा एक दोस्त है, वह भी AI है। हम दोनों बहुत स्मार्ट हैं!",
-            "मजाक: मैंने एक बार कहा था मैं ऑफलाइन हूं, लेकिन कोई मान ही नहीं रहा था!"
-        ]
+        # TTS worker on the A55 cores: renders the next sentence during playback
+        self.tts_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, initializer=pin_current_thread, initargs=(A55_CORES,)
+        )
         
-        # Normalize all phrases to NFC for consistent matching
-        common_responses = [unicodedata.normalize('NFC', p) for p in raw_responses]
+        # Load Piper once in-process (no interpreter spawn + pipe copy per utterance).
+        # Loaded on the TTS worker so Piper's ORT threads stay on the A55 cores
+        self.piper_voice = None
+        if os.path.exists(self.piper_model):
+            try:
+                self.piper_voice = self.tts_executor.submit(load_piper_voice, self.piper_model).result()
+                self.piper_sample_rate = self.piper_voice.config.sample_rate
+            except Exception as e:
+                print(f"⚠️  Piper voice load failed: {e} (using eSpeak)")
         
-        def cache_audio(phrase):
+        # Warm-up synthesis so the first reply doesn't pay for phonemizer init
+        # and ORT's first-run allocations (the pre-cache is background work)
+        if self.piper_voice:
             try:
-                # Use absolute path to python if needed, but sys.executable is usually right
-                process = subprocess.Popen(
-                    [sys.executable, '-m', 'piper', '--model', self.piper_model, '--output-raw'],
-                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-                )
-                # Increased timeout for SBC stability
-                audio_data, stderr_data = process.communicate(input=phrase.encode('utf-8'), timeout=30)
-                
-                if process.returncode != 0:
-                    return phrase, None, f"Piper exited with code {process.returncode}: {stderr_data.decode()}"
-                
-                return phrase, audio_data, None
-            except subprocess.TimeoutExpired:
-                return phrase, None, "Timeout (30s) expired during generation"
+                self.tts_executor.submit(piper_synthesize, self.piper_voice, "नमस्ते").result()
+                print("✓ Piper warmed up")
             except Exception as e:
-                return phrase, None, str(e)
-
-        # Use only 2 workers to avoid CPU/RAM starvation on SBC
-        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-            results = list(executor.map(cache_audio, common_responses))
-            for phrase, audio, error in results:
-                if audio:
-                    self.audio_cache[phrase] = audio
-                    # print(f"   ✓ Cached (len={len(audio)}): {phrase}")
-                else:
-                    print(f"   ⚠️ Failed to cache '{phrase[:20]}...': {error}")
+                print(f"⚠️  TTS warm-up skipped: {e}")
+        
+        # One output stream for the whole session
+        self.output_stream = self.audio.open(format=pyaudio.paInt16, channels=1,
+                                             rate=self.piper_sample_rate, output=True,
+                                             frames_per_buffer=1024)
         
-        print(f"   ✓ Successfully cached {len(self.audio_cache)}/{len(common_responses)} responses (~{len(self.audio_cache) * 0.05:.1f}MB RAM)")
+        # Pre-cache ALL static responses for instant playback, in the background:
+        # listening starts right away, uncached replies are synthesized live
+        print("\n[TTS] Pre-generating all static responses in the background...")
+        self.audio_cache = {}
+        # Live replies pause the cache chain: speak() parks the remaining
+        # phrases here and resumes them once the reply has been rendered
+        self.precache_lock = threading.Lock()
+        self.precache_paused = None
+        self.speaking = False
         
-        self.HINDI_MONTHS = {
-            'January': 'जनवरी', 'February': 'फ़रवरी', 'March': 'मार्च',
-            'April': 'अप्रैल', 'May': 'मई', 'June': 'जून',
-            'July': 'जुलाई', 'August': 'अगस्त', 'September': 'सितंबर',
-            'October': 'अक्टूबर', 'November': 'नवंबर', 'December': 'दिसंबर'
+        # Static responses that never change (module constants, already NFC)
+        common_responses = [*STATIC_RESPONSES.values(), UNKNOWN_RESPONSE, *JOKES]
+        if self.piper_voice:
+            self._precache(iter(common_responses))
+        
+        # Per-turn response builders (everything else is in STATIC_RESPONSES)
+        self.dynamic_responses = {
+            'time': self._time_response,
+            'date': self._date_response,
+            'joke': self._joke_response,
         }
+        self.jokes = itertools.cycle(JOKES)  # rotate, never repeat back-to-back
         
         gc.collect() # Clean up after model loading
         print("\n✓ All systems ready!\n")
 
     def record_with_vad(self):
         print("\n🎤 Listening... (speak now)")
-        stream = self.audio.open(format=self.FORMAT, channels=self.CHANNELS,
-                               rate=self.RATE, input=True,
-                               frames_per_buffer=self.CHUNK)
+        stream = self.input_stream
+        stream.start_stream()
         
-        frames = []
-        ring_buffer = collections.deque(maxlen=10)
+        buffer = self.record_buffer
+        offset = 0
+        ring_buffer = collections.deque(maxlen=10)  # pre-roll frames
+        voiced_bits = 0  # bit i set = i-th most recent frame was speech
+        voiced_mask = (1 << ring_buffer.maxlen) - 1
         triggered = False
         silence_frames = 0
         start_time = time.time()
         speech_start = 0
+        speculative_frames = int(self.speculative_silence * self.RATE / self.CHUNK)
+        pending_asr = None
+        speculative_job = None  # last speculative ASR, kept until it has finished
+        asr_abort = None  # set when speech resumes: stops a stale speculative decode
+        noise_energies = []
+        noise_floor = None  # frame energy at or below this is silence, no VAD call
         
         while True:
             frame = stream.read(self.CHUNK, exception_on_overflow=False)
-            is_speech = self.vad.is_speech(frame, self.RATE)
+            samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32)
+            energy = float(np.dot(samples, samples))
+            if noise_floor is None:
+                noise_energies.append(energy)
+                if len(noise_energies) == self.noise_calibration_frames:
+                    # Quietest calibration frame +3 dB: safe even if speech starts early
+                    noise_floor = 2.0 * min(noise_energies)
+                is_speech = self.vad.is_speech(frame, self.RATE)
+            else:
+                is_speech = energy > noise_floor and self.vad.is_speech(frame, self.RATE)
             
             if not triggered:
-                ring_buffer.append((frame, is_speech))
-                num_voiced = len([f for f, s in ring_buffer if s])
-                if num_voiced > 0.6 * ring_buffer.maxlen:
+                ring_buffer.append(frame)
+                voiced_bits = ((voiced_bits << 1) | is_speech) & voiced_mask
+                if voiced_bits.bit_count() > 0.6 * ring_buffer.maxlen:
                     triggered = True
                     print("🔴 Recording...")
                     speech_start = time.time()
-                    for f, s in ring_buffer: frames.append(f)
+                    for f in ring_buffer:
+                        buffer[offset:offset + len(f)] = f
+                        offset += len(f)
                     ring_buffer.clear()
+                    voiced_bits = 0
             else:
-                frames.append(frame)
+                buffer[offset:offset + len(frame)] = frame
+                offset += len(frame)
                 if not is_speech:
                     silence_frames += 1
                 else:
                     silence_frames = 0
+                    if pending_asr:
+                        # Speech resumed: the speculative ASR is stale. Drop it
+                        # if queued, else stop it at its next segment boundary
+                        asr_abort.set()
+                        pending_asr.cancel()
+                        pending_asr = None
+                
+                if silence_frames == speculative_frames and (speculative_job is None or speculative_job.done()):
+                    # Likely the end: transcribe the (already trimmed) audio now.
+                    # If no speech follows, it is exactly what would be returned.
+                    # Skipped while an aborted decode still holds the ASR worker
+                    end = offset - (silence_frames - 2) * self.CHUNK * 2
+                    asr_abort = threading.Event()
+                    pending_asr = speculative_job = self.asr_executor.submit(
+                        self._transcribe, self._buffer_to_audio(end), asr_abort
+                    )
                 
                 curr_time = time.time()
                 silence_dur = (silence_frames * self.CHUNK) / self.RATE
@@ -656,169 +1071,207 @@ class RealtimeVoiceAssistant:
                     break
                     
         stream.stop_stream()
-        stream.close()
+        
+        # Drop the trailing silence (keep ~60 ms tail): Whisper cost scales with length
+        if silence_frames > 2:
+            offset -= (silence_frames - 2) * self.CHUNK * 2
         
         duration = time.time() - speech_start
         if triggered and duration >= self.min_speech_duration:
-            with wave.open(self.TEMP_WAV, 'wb') as wf:
-                wf.setnchannels(self.CHANNELS)
-                wf.setsampwidth(self.audio.get_sample_size(self.FORMAT))
-                wf.setframerate(self.RATE)
-                wf.writeframes(b''.join(frames))
-            return True
-        return False
+            return self._buffer_to_audio(offset), pending_asr
+        if pending_asr:
+            asr_abort.set()
+            pending_asr.cancel()
+        return None, None
+    
+    def _buffer_to_audio(self, length):
+        # 16 kHz mono float32 in [-1, 1): what Whisper expects, no WAV round-trip
+        return np.frombuffer(self.record_buffer, dtype=np.int16, count=length // 2).astype(np.float32) / 32768.0
 
     def generate_response(self, intent):
-        now = datetime.now()
-        response = ""
-        
-        if intent == "time":
-            response = f"अभी समय है {now.strftime('%I:%M %p')}"
-        elif intent == "date":
-            month_hindi = self.HINDI_MONTHS.get(now.strftime('%B'), now.strftime('%B'))
-            response = f"आज की तारीख है {now.day} {month_hindi} {now.year}"
-        elif intent == "hello":
-            response = "नमस्ते! मेरा नाम भारत AI है, मैं आपकी कैसे मदद कर सकता हूं?"
-        elif intent == "thank_you":
-            response = "आपका स्वागत है!"
-        elif intent == "help":
-            response = "मैं जोक सुना सकता हूँ, संगीत बजा सकता हूँ और नाच भी सकता हूँ। समाचार और मौसम अभी ऑफलाइन हैं, लेकिन मैं समय और तारीख बता सकता हूँ। आप क्या जानना चाहते हैं?"
-        elif intent == "stop":
-            response = "ठीक है, बंद कर रहा हूं।"
-        elif intent == 'dance':
-            response = "मैं नाच रहा हूं... धिन धिन धा! लेकिन मेरे पास पैर नहीं हैं!"
-        elif intent == 'weather':
-            response = "मौसम की जानकारी उपलब्ध नहीं है। मैं ऑफलाइन काम करता हूं। लेकिन आज दिन अच्छा लग रहा है!"
-        elif intent == 'joke':
-            if not hasattr(self, '_joke_index'):
-                self._joke_index = 0
-            
-            jokes = [
-                "एक रोबोट डॉक्टर के पास गया। डॉक्टर बोला: आप तो बिल्कुल फिट हैं... बस थोड़ा ऑयल चाहिए!",
-                "मेरा एक दोस्त है, वह भी AI है। हम दोनों बहुत स्मार्ट हैं!",
-                "मजाक: मैंने एक बार कहा था मैं ऑफलाइन हूं, लेकिन कोई मान ही नहीं रहा था!"
-            ]
-            response = jokes[self._joke_index % len(jokes)]
-            self._joke_index += 1
-        elif intent == 'music':
-            response = "गाना बजा रहा हूं... धुन धुन धु! वैसे मैं अभी स्पीकर से जुड़ा नहीं हूं।"
-        elif intent == 'news':
-            response = "समाचार सेवा ऑफलाइन है। लेकिन आज का दिन बहुत अच्छा है!"
-        else:
-            response = "माफ़ करें, मैं समझ नहीं पाया। कृपया फिर से बोलें।"
-        
-        # CRITICAL: Normalize to NFC before returning to ensure cache hit
-        return unicodedata.normalize('NFC', response)
+        # Fixed replies are prebuilt (already NFC, so they hit the audio cache);
+        # only time/date/joke are built per turn
+        response = STATIC_RESPONSES.get(intent)
+        if response is None:
+            builder = self.dynamic_responses.get(intent)
+            response = builder() if builder else UNKNOWN_RESPONSE
+        return response
+    
+    def _time_response(self):
+        return clock_response('time', int(time.time()))
+    
+    def _date_response(self):
+        return clock_response('date', int(time.time()))
+    
+    def _joke_response(self):
+        return next(self.jokes)
 
+    def _precache(self, phrases):
+        """Cache the next phrase on the TTS worker; one task at a time so live speech can cut in"""
+        with self.precache_lock:
+            if self.speaking:
+                self.precache_paused = phrases
+                return
+        phrase = next(phrases, None)
+        if phrase is None:
+            if DEBUG:
+                print(f"   ✓ Cached {len(self.audio_cache)} responses (~{len(self.audio_cache) * 0.05:.1f}MB RAM)")
+            return
+        
+        def store(future):
+            if future.cancelled():
+                return  # executor shutting down
+            try:
+                self.audio_cache[phrase] = future.result()
+            except Exception as e:
+                print(f"   ⚠️ Failed to cache '{phrase[:20]}...': {e}")
+            self._precache(phrases)
+        
+        try:
+            self.tts_executor.submit(piper_synthesize, self.piper_voice, phrase).add_done_callback(store)
+        except RuntimeError:
+            pass  # executor shut down: assistant is exiting
+    
     def speak(self, text):
-        print(f"🔊 Speaking (Natural Voice)...")
+        if DEBUG:
+            print(f"🔊 Speaking (Natural Voice)...")
         
         # Check cache first for instant playback
         # Normalize input text to NFC for consistent matching
         norm_text = unicodedata.normalize('NFC', text)
         
         if hasattr(self, 'audio_cache') and norm_text in self.audio_cache:
-            print(f"   ✓ Using cached audio (0.0s)")
-            audio_data = self.audio_cache[norm_text]
-            
+            if DEBUG:
+                print(f"   ✓ Using cached audio (0.0s)")
             # Play cached audio immediately
-            p = pyaudio.PyAudio()
-            stream = p.open(format=pyaudio.paInt16, channels=1, 
-                            rate=self.piper_sample_rate, output=True,
-                            frames_per_buffer=256)
-            stream.write(audio_data)
-            stream.stop_stream()
-            stream.close()
-            p.terminate()
-            
+            self.output_stream.write(self.audio_cache[norm_text])
             return
         
         # If not cached, generate fresh audio
-        print(f"   Generating fresh audio...")
+        if DEBUG:
+            print(f"   Generating fresh audio...")
         
-        if os.path.exists(self.piper_model):
+        if self.piper_voice:
+            # Hold back background caching so no sentence waits behind a cache
+            # phrase (only the one already running, if any, before the first)
+            with self.precache_lock:
+                self.speaking = True
             try:
-                process = subprocess.Popen(
-                    [sys.executable, '-m', 'piper', '--model', self.piper_model, '--output-raw'],
-                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-                )
-                audio_data, stderr_data = process.communicate(input=text.encode('utf-8'), timeout=10)
-                
-                # Show Piper errors if any
-                if process.returncode != 0:
-                    error_msg = stderr_data.decode()[:200] if stderr_data else "Unknown error"
-                    print(f"   ⚠️ Piper failed: {error_msg}")
-                    raise Exception("Piper TTS failed")
-                
-                if audio_data:
-                    p = pyaudio.PyAudio()
-                    stream = p.open(format=pyaudio.paInt16, channels=1, 
-                                    rate=self.piper_sample_rate, output=True,
-                                    frames_per_buffer=1024)
-                    stream.write(audio_data)
-                    stream.stop_stream()
-                    stream.close()
-                    p.terminate()
-                    
+                # Play each sentence as soon as it is synthesized (no join/copy),
+                # rendering the next one on the TTS thread meanwhile
+                sentences = piper_stream(self.piper_voice, text)
+                pending = self.tts_executor.submit(next, sentences, None)
+                played = False
+                while True:
+                    audio_data = pending.result()
+                    if audio_data is None:
+                        break
+                    pending = self.tts_executor.submit(next, sentences, None)
+                    self.output_stream.write(audio_data)
+                    played = True
+                if played:
                     return
-            except subprocess.TimeoutExpired:
-                print("   ⚠️  Piper timeout, using fallback")
-                process.kill()
             except Exception as e:
                 print(f"   ⚠️  Piper failed: {e}")
+            finally:
+                with self.precache_lock:
+                    self.speaking = False
+                    phrases, self.precache_paused = self.precache_paused, None
+                if phrases:
+                    self._precache(phrases)
         
         # Fallback to eSpeak
         subprocess.run(['espeak-ng', '-v', 'hi', '-s', '150', text], check=False)
 
+    def _understand(self, raw_text):
+        """Layer 2 + 3: grammar correction then intent classification"""
+        corrected = self.corrector.correct(raw_text)
+        return self.intent_classifier.classify(corrected)
+    
+    def _transcribe(self, audio, abort=None):
+        """Layer 1: ASR, returns (raw text, speculative (partial, NLU future) or None)"""
+        speculative = None
+        abort = abort or threading.Event()  # set by capture when speech resumes
+        if abort.is_set():
+            return "", None
+        if self.use_faster_whisper:
+            # Transcribe using faster-whisper (SPEED-OPTIMIZED)
+            segments, info = self.asr_model.transcribe(
+                audio,
+                beam_size=3,
+                language="hi",
+                task="transcribe",
+                initial_prompt="यह हिंदी वॉयस असिस्टेंट है। बंद करो। बंद हो जाओ। समय क्या है। आज कौन सा दिन है। गाना सुनाओ। मजाक सुनाओ। मौसम बताओ। नमस्ते। धन्यवाद। शुक्रिया।",
+                vad_filter=True,
+                condition_on_previous_text=False,
+                without_timestamps=True,  # only segment text is used
+                best_of=1,
+                temperature=0.0,
+                compression_ratio_threshold=2.4,
+                log_prob_threshold=-1.0,
+                no_speech_threshold=0.6
+            )
+            
+            # Check if Hindi was detected
+            if info.language != "hi" and not abort.is_set():
+                print(f"⚠️  Wrong language: {info.language} (prob: {info.language_probability:.0%})")
+                print(f"   Forcing Hindi retry...")
+                segments, info = self.asr_model.transcribe(
+                    audio,
+                    language="hi",
+                    task="transcribe",
+                    beam_size=5,
+                    without_timestamps=True,
+                    initial_prompt="हिंदी हिंदी। बंद करो। बंद हो जाओ। समय क्या है। गाना सुनाओ। मजाक सुनाओ।"
+                )
+            
+            # Segments decode lazily: start correction + intent on each
+            # partial while Whisper is still working on the rest
+            parts = []
+            for segment in segments:
+                if abort.is_set():
+                    break  # stale speculative decode: free the worker for the real one
+                parts.append(segment.text)
+                if speculative:
+                    speculative[1].cancel()  # stale partial, drop if not started
+                partial = " ".join(parts).strip()
+                speculative = (partial, self.nlu_executor.submit(self._understand, partial))
+            raw_text = " ".join(parts).strip()
+        else:
+            # Fallback to standard whisper
+            result = self.asr_standard.transcribe(audio, language="hi", fp16=False)
+            raw_text = result['text'].strip()
+        return raw_text, speculative
+    
     def run(self):
         try:
             while True:
-                if self.record_with_vad():
-                    if self.use_faster_whisper:
-                        # Transcribe using faster-whisper (SPEED-OPTIMIZED)
-                        segments, info = self.asr_model.transcribe(
-                            self.TEMP_WAV,
-                            beam_size=3,
-                            language="hi",
-                            task="transcribe",
-                            initial_prompt="यह हिंदी वॉयस असिस्टेंट है। बंद करो। बंद हो जाओ। समय क्या है। आज कौन सा दिन है। गाना सुनाओ। मजाक सुनाओ। मौसम बताओ। नमस्ते। धन्यवाद। शुक्रिया।",
-                            vad_filter=True,
-                            condition_on_previous_text=False,
-                            best_of=1,
-                            temperature=0.0,
-                            compression_ratio_threshold=2.4,
-                            log_prob_threshold=-1.0,
-                            no_speech_threshold=0.6
-                        )
-                        
-                        # Check if Hindi was detected
-                        if info.language != "hi":
-                            print(f"⚠️  Wrong language: {info.language} (prob: {info.language_probability:.0%})")
-                            print(f"   Forcing Hindi retry...")
-                            segments, info = self.asr_model.transcribe(
-                                self.TEMP_WAV,
-                                language="hi",
-                                task="transcribe",
-                                beam_size=5,
-                                initial_prompt="हिंदी हिंदी। बंद करो। बंद हो जाओ। समय क्या है। गाना सुनाओ। मजाक सुनाओ।"
-                            )
-
-                        raw_text = " ".join([segment.text for segment in segments]).strip()
-                    else:
-                        # Fallback to standard whisper
-                        result = self.asr_standard.transcribe(self.TEMP_WAV, language="hi", fp16=False)
-                        raw_text = result['text'].strip()
+                # Audio capture + VAD is light: keep it on the A55 cluster
+                pin_current_thread(A55_CORES)
+                audio, pending_asr = self.record_with_vad()
+                pin_current_thread(A76_CORES)
+                
+                if audio is not None:
+                    # Reuse the transcription started during the silence tail
+                    if pending_asr is None:
+                        pending_asr = self.asr_executor.submit(self._transcribe, audio)
+                    raw_text, speculative = pending_asr.result()
                         
-                    print(f"📝 Raw transcription: '{raw_text}'")
+                    if DEBUG:
+                        print(f"📝 Raw transcription: '{raw_text}'")
                     
-                    corrected = self.corrector.correct(raw_text)
-                    
-                    intent, conf = self.intent_classifier.classify(corrected)
-                    print(f"🎯 Intent: {intent} (confidence: {conf:.1%})")
+                    # Reuse the speculative result when the last partial was final
+                    if speculative and speculative[0] == raw_text:
+                        intent, conf = speculative[1].result()
+                    else:
+                        intent, conf = self._understand(raw_text)
+                    if DEBUG:
+                        print(f"🎯 Intent: {intent} (confidence: {conf:.1%})")
                     
                     response = self.generate_response(intent)
                     
-                    print(f"💬 Response: {response}")
+                    if DEBUG:
+                        print(f"💬 Response: {response}")
                     self.speak(response)
                     
                     # Exit commands (no timeout condition)
@@ -829,7 +1282,12 @@ class RealtimeVoiceAssistant:
         except KeyboardInterrupt:
             print("\n👋 Stopped by user")
         finally:
-            if os.path.exists(self.TEMP_WAV): os.remove(self.TEMP_WAV)
+            self.asr_executor.shutdown(wait=False, cancel_futures=True)
+            self.nlu_executor.shutdown(wait=False)
+            self.tts_executor.shutdown(wait=False)
+            self.input_stream.close()
+            self.output_stream.stop_stream()
+            self.output_stream.close()
             self.audio.terminate()
 
 if __name__ == "__main__":